@@ -6,15 +6,47 @@ from google import genai
 from google.genai import types
 import os
 import time
+from functools import lru_cache
 from jinja2 import Environment, FileSystemLoader
 from app.utils.rag import load_style_guide_snippets
-from app.core.prompts import MASTER_PROMPT_TEMPLATE
 from app.core.models import GeneratedCode, CodeFile
 from app.utils.parser import parse_fields, Field
 from app.utils.api_key_manager import APIKeyManager
 from typing import List, Optional
 
 
+# Structured-output config shared by every generation call, validated once at import.
+# The schema stays the GeneratedCode class so response.parsed is a GeneratedCode instance.
+_GENERATION_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json",
+    response_schema=GeneratedCode
+)
+
+
+@lru_cache(maxsize=1)
+def _get_auth_template_env() -> Environment:
+    """
+    Build the Jinja2 environment for auth templates once per process.
+    Reusing it keeps Jinja2's compiled-template cache warm across requests.
+    """
+    template_dir = os.path.join("data", "templates", "auth")
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True
+    )
+
+
+@lru_cache(maxsize=32)
+def _get_client(api_key: str) -> genai.Client:
+    """
+    Return a Gemini client for `api_key`, created on first use and then reused.
+    Reusing the client keeps its HTTP connection pool warm across requests.
+    """
+    return genai.Client(api_key=api_key)
+
+
 def _generate_static_auth_files(database_type: str) -> List[CodeFile]:
     """
     Generate authentication files statically from Jinja2 templates.
@@ -26,14 +58,8 @@ def _generate_static_auth_files(database_type: str) -> List[CodeFile]:
     Returns:
         List of CodeFile objects for all auth-related files
     """
-    # Setup Jinja2 environment
-    template_dir = os.path.join("data", "templates", "auth")
-    env = Environment(
-        loader=FileSystemLoader(template_dir),
-        trim_blocks=True,
-        lstrip_blocks=True,
-        keep_trailing_newline=True
-    )
+    # Shared Jinja2 environment (templates are compiled once per process)
+    env = _get_auth_template_env()
     
     # Template context
     context = {"database_type": database_type}
@@ -91,29 +117,22 @@ def _generate_static_auth_files(database_type: str) -> List[CodeFile]:
     return auth_files
 
 
-def _generate_core_crud_files(
-    client: genai.Client,
-    resource: str,
-    fields_str: str,
-    project_name: str,
+@lru_cache(maxsize=8)
+def _core_prompt_prefix(
     database_type: str,
-    style_guide: str,
-    database_type_instructions: str,
     database_specific_instructions: str,
-    model_name: str
-) -> GeneratedCode:
-    """Generate only core CRUD files (no auth)."""
-    from app.utils.parser import parse_fields
-    
-    parsed_fields = parse_fields(fields_str)
-    fields_list_str = "\n".join([f"- **{f.name}**: {f.type}" for f in parsed_fields])
-    
-    # Simplified prompt for core CRUD only (Chinese for token efficiency)
-    core_prompt = f"""# 角色 / PERSONA
+    style_guide: str
+) -> str:
+    """
+    Build the request-independent part of the core CRUD prompt, once per distinct input.
+    It contains nothing user-specific, so it is byte-identical for every request with
+    the same database type and Gemini's implicit prefix caching can reuse it.
+    """
+    return f"""# 角色 / PERSONA
 你是一位专精FastAPI的高级软件工程师。编写简洁、规范、健壮且文档完善的Python代码。
 
 # 任务 / TASK
-为名为{project_name}的FastAPI应用生成核心CRUD功能文件（不含认证）。
+为FastAPI应用生成核心CRUD功能文件（不含认证）。项目名称、资源名称和字段见末尾的用户输入。
 
 # 必须生成的文件 / REQUIRED FILES
 1. app/core/config.py - 使用STYLE GUIDE中的config.py.example，内容必须完全一致
@@ -154,14 +173,39 @@ def _generate_core_crud_files(
 # 风格指南 / STYLE GUIDE
 {style_guide}
 
+# 输出格式 / OUTPUT
+返回JSON对象，符合GeneratedCode Pydantic模式。仅包含上述9个文件。不要生成认证相关文件。"""
+
+
+def _generate_core_crud_files(
+    client: genai.Client,
+    resource: str,
+    fields_str: str,
+    project_name: str,
+    database_type: str,
+    style_guide: str,
+    database_type_instructions: str,
+    database_specific_instructions: str,
+    model_name: str
+) -> GeneratedCode:
+    """Generate only core CRUD files (no auth)."""
+    from app.utils.parser import parse_fields
+    
+    parsed_fields = parse_fields(fields_str)
+    fields_list_str = "\n".join([f"- **{f.name}**: {f.type}" for f in parsed_fields])
+    
+    # Static prefix first, per-request input last (Chinese for token efficiency)
+    core_prompt = _core_prompt_prefix(
+        database_type=database_type,
+        database_specific_instructions=database_specific_instructions,
+        style_guide=style_guide
+    ) + f"""
+
 # 用户输入 / USER INPUT
 - 项目名称：{project_name}
 - 资源名称：{resource}
 - 字段：
-{fields_list_str}
-
-# 输出格式 / OUTPUT
-返回JSON对象，符合GeneratedCode Pydantic模式。仅包含上述9个文件。不要生成认证相关文件。"""
+{fields_list_str}"""
     
     print("📦 Generating core CRUD files (9 files)...")
     
@@ -174,10 +218,7 @@ def _generate_core_crud_files(
             response = client.models.generate_content(
                 model=model_name,
                 contents=core_prompt,
-                config={
-                    "response_mime_type": "application/json",
-                    "response_schema": GeneratedCode
-                }
+                config=_GENERATION_CONFIG
             )
             print("✅ Core CRUD files generated successfully")
             return response.parsed
@@ -284,8 +325,8 @@ def generate_crud_feature(
         raise_if_missing=True
     )
     
-    # Initialize Gemini client
-    client = genai.Client(api_key=resolved_key)
+    # Shared Gemini client for this key (created lazily on first request)
+    client = _get_client(resolved_key)
     
     # Parse fields
     parsed_fields: List[Field] = []
@@ -318,6 +359,10 @@ SQL数据库：
 # - Use `Session` from SQLAlchemy for database operations
 - 使用`select()`语句或`session.query()`
 # - Use `select()` statements or `session.query()`
+- 按主键获取使用`db.get(Model, id)`（先查会话标识映射，端点先get再update/remove时不会重复SELECT）
+# - Fetch by primary key with `db.get(Model, id)` (identity-map first, so get-then-update/remove in an endpoint costs one SELECT)
+- 端点使用普通`def`而非`async def`（同步Session在线程池中运行，不阻塞事件循环）
+# - Declare endpoints with plain `def`, not `async def` (the sync Session then runs in the threadpool instead of blocking the event loop)
 """
     else:  # mongodb
         database_type_instructions = "使用MongoDB，配合Beanie ODM或Motor异步驱动"  # Use MongoDB with Beanie ODM or Motor async driver
@@ -4,6 +4,8 @@
 # Note the detailed instructions, the persona, the rules, and the output format specification.
 # This level of detail is necessary to get reliable results.
 
+__all__ = ["MASTER_PROMPT_TEMPLATE"]
+
 MASTER_PROMPT_TEMPLATE = """
 # 角色 / PERSONA
 # You are an expert senior software engineer specializing in FastAPI. You write clean, idiomatic, robust, and well-documented Python code that adheres to modern best practices.
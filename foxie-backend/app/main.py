@@ -1,4 +1,5 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 import os
@@ -16,6 +17,18 @@ except ImportError as e:
 
 # --- FastAPI Application ---
 
+def _json_response(generated_code: GeneratedCode) -> Response:
+    """
+    Serialize GeneratedCode with pydantic-core directly.
+    Returning a Response skips FastAPI's response_model re-validation and
+    jsonable_encoder pass, which dominate CPU for multi-KB file payloads.
+    """
+    return Response(
+        content=generated_code.model_dump_json(),
+        media_type="application/json"
+    )
+
+
 class ScaffoldRequest(BaseModel):
     """The request body expected from the CLI."""
     project_name: str = Field(..., description="Name of the project.")
@@ -32,6 +45,10 @@ app = FastAPI(
     version=config.version
 )
 
+# Generated-code responses are large, highly repetitive JSON; the CLI's requests
+# session already advertises gzip, so compress anything beyond a small payload.
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 
 @app.post("/scaffold", response_model=GeneratedCode)
 async def scaffold_feature(request: ScaffoldRequest):
@@ -66,10 +83,10 @@ async def scaffold_feature(request: ScaffoldRequest):
         if not generated_code or not generated_code.files:
              print("Warning: AI generation returned empty result.")
              # Return an empty list or raise error, depending on desired behaviour
-             return GeneratedCode(files=[]) # Return empty list
+             return _json_response(GeneratedCode(files=[])) # Return empty list
 
         print(f"Successfully generated {len(generated_code.files)} files. Sending response to CLI.")
-        return generated_code
+        return _json_response(generated_code)
 
     except Exception as e:
         # Log the full error on the backend for debugging
@@ -3,9 +3,27 @@ API Key Management Utility for Foxie Platform.
 Handles Google Gemini API key validation.
 Backend expects API keys to be provided via requests (users use their own keys).
 """
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=1024)
+def _validate_key_format_cached(api_key: str) -> bool:
+    """
+    Memoized format check for string keys.
+    Clients resend the same few keys on every request; maxsize bounds the
+    cache so a caller cycling through random keys cannot grow it unbounded.
+    """
+    # Remove whitespace
+    api_key = api_key.strip()
+    
+    # Basic format check (Google keys usually start with AIza)
+    if len(api_key) < 20:  # Too short
+        return False
+    
+    return True
+
+
 class APIKeyManager:
     """Manages Google Gemini API key validation."""
     
@@ -56,17 +74,11 @@ class APIKeyManager:
         Returns:
             True if format looks valid, False otherwise
         """
+        # Type check first: non-string values may be unhashable
         if not api_key or not isinstance(api_key, str):
             return False
         
-        # Remove whitespace
-        api_key = api_key.strip()
-        
-        # Basic format check (Google keys usually start with AIza)
-        if len(api_key) < 20:  # Too short
-            return False
-        
-        return True
+        return _validate_key_format_cached(api_key)
     
     @classmethod
     def check_api_key_exists(cls, provided_key: Optional[str] = None) -> bool:
@@ -1,7 +1,10 @@
-from pydantic import BaseModel
-from typing import List
+import re
+from typing import List, NamedTuple
 
-class Field(BaseModel):
+# Any whitespace means the input needs the stripping path below
+_WHITESPACE_RE = re.compile(r"\s")
+
+class Field(NamedTuple):
   name : str
   type : str
   
@@ -9,6 +12,19 @@ class Field(BaseModel):
 def parse_fields(fields_str : str)->List[Field]:
   Fields=[]
   
+  # Fast path for the common well-formed input ("name:str,age:int"): nothing to strip
+  if not _WHITESPACE_RE.search(fields_str):
+    for pair in fields_str.split(","):
+      if not pair:
+        continue
+      name, sep, type_str = pair.partition(":")
+      if not sep or ":" in type_str:
+        raise ValueError(f"Invalid field format: '{pair}'. Expected 'name:type'.")
+      if not name or not type_str:
+        raise ValueError(f"Invalid field format: '{pair}'. Name and type cannot be empty.")
+      Fields.append(Field(name=name,type=type_str))
+    return Fields
+  
   field_pairs = fields_str.split(",")
   
   for pair in field_pairs:
@@ -16,12 +32,13 @@ def parse_fields(fields_str : str)->List[Field]:
     if not clean_pair:
       continue
     
-    parts = clean_pair.split(":")
-    if(len(parts)!=2):
+    # partition stops at the first ':' without building an intermediate list
+    name, sep, type_str = clean_pair.partition(":")
+    if not sep or ":" in type_str:
       raise ValueError(f"Invalid field format: '{clean_pair}'. Expected 'name:type'.")
     
-    name  = parts[0].strip()
-    type_str = parts[1].strip()
+    name = name.strip()
+    type_str = type_str.strip()
     
     if not name or not type_str:
       raise ValueError(f"Invalid field format: '{clean_pair}'. Name and type cannot be empty.")
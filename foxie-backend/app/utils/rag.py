@@ -1,7 +1,17 @@
+import io
 import os
 import typer
 import re
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+# Assembled style guides keyed by call arguments. Each entry stores the
+# (filename, mtime) signature it was built from so edited examples are reloaded.
+_SNIPPET_CACHE: Dict[Tuple[str, str, bool], Tuple[tuple, str]] = {}
+
+# Patterns used by _optimize_example_content, compiled once at import
+_SKIP_BLOCK_RE = re.compile(r'^#\s*(?:NOSQL|SQL)\s+VERSION', re.IGNORECASE)
+_MARKER_RE = re.compile(r'^#\s*---\s*(?:START|END):')
 
 def _optimize_example_content(content: str, filename: str) -> str:
     """
@@ -10,33 +20,49 @@ def _optimize_example_content(content: str, filename: str) -> str:
     - Remove excessive whitespace
     - Keep only essential code and comments
     """
-    lines = content.split('\n')
-    optimized_lines = []
+    # Iterating a StringIO yields lines split on '\n' only, ends included, so
+    # lines are copied straight into the output without a split list or join
+    out = io.StringIO()
     skip_block = False
+    previous_blank = False
     
-    for line in lines:
+    for line in io.StringIO(content):
+        # Both patterns are anchored on '#', so plain code lines skip the regex engine
+        is_comment = line.startswith('#')
+        
         # Skip large commented-out code blocks (alternative implementations)
-        if re.match(r'^#\s*(NOSQL|SQL)\s+VERSION', line, re.IGNORECASE):
+        if is_comment and _SKIP_BLOCK_RE.match(line):
             skip_block = True
             continue
-        if skip_block and line.strip() and not line.strip().startswith('#'):
-            # Check if we've reached the end of the commented block
-            if not line.strip().startswith('#') and line.strip():
-                skip_block = False
         if skip_block:
-            continue
+            # The commented block ends at the first non-blank, non-comment line
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#'):
+                continue
+            skip_block = False
             
         # Remove lines that are just "--- START/END" markers (we'll add our own)
-        if re.match(r'^#\s*---\s*(START|END):', line):
+        if is_comment and _MARKER_RE.match(line):
             continue
+        
+        # Clean up excessive blank lines (max 2 consecutive newlines)
+        if line == '\n':
+            if previous_blank:
+                continue
+            previous_blank = True
+        else:
+            previous_blank = False
             
-        optimized_lines.append(line)
+        out.write(line)
     
-    # Join and clean up excessive blank lines (max 2 consecutive)
-    result = '\n'.join(optimized_lines)
-    result = re.sub(r'\n{3,}', '\n\n', result)
-    
-    return result.strip()
+    return out.getvalue().strip()
+
+def _read_and_optimize(entry: os.DirEntry) -> str:
+    """Read one example file and return its optimized snippet with a concise header."""
+    with open(entry.path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    # Optimize content to reduce tokens
+    return f"# {entry.name}\n{_optimize_example_content(content, entry.name)}"
 
 def load_style_guide_snippets(
     base_dir: str = "data/rag_knowledge_base/fastapi",
@@ -53,8 +79,6 @@ def load_style_guide_snippets(
         database_type: "sql" or "mongodb"
         enable_auth: Whether to include auth examples
     """
-    snippets: List[str] = []
-    
     # Core files that are always included
     core_files = [
         "config.py.example",
@@ -87,20 +111,34 @@ def load_style_guide_snippets(
     files_to_load = core_files + db_files + auth_files
     
     try:
-        # Load only the relevant files
-        for filename in files_to_load:
-            file_path = os.path.join(base_dir, filename)
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Optimize content to reduce tokens
-                    optimized_content = _optimize_example_content(content, filename)
-                    # Add concise headers
-                    snippets.append(f"# {filename}\n{optimized_content}")
-                    
+        # One directory scan tells us which examples exist, so missing files
+        # cost no extra syscall. DirEntry also caches its stat() result.
+        with os.scandir(base_dir) as entries:
+            available = {entry.name: entry for entry in entries if entry.is_file()}
+        
+        # The mtimes of the files we will use form the cache signature
+        to_load = [available[filename] for filename in files_to_load if filename in available]
+        signature = tuple((entry.name, entry.stat().st_mtime_ns) for entry in to_load)
+        
+        cache_key = (base_dir, database_type, enable_auth)
+        cached = _SNIPPET_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        # Load only the relevant files. File reads release the GIL, so the
+        # handful of examples are read concurrently and streamed into one buffer.
+        buf = io.StringIO()
+        if to_load:
+            with ThreadPoolExecutor(max_workers=len(to_load)) as executor:
+                for i, snippet in enumerate(executor.map(_read_and_optimize, to_load)):
+                    if i:
+                        buf.write("\n\n")
+                    buf.write(snippet)
     except FileNotFoundError:
         # Don't fail the whole app, just warn the user
         typer.secho(f"Warning: RAG directory not found at {base_dir}. Skipping style guide.", fg=typer.colors.YELLOW)
         return ""
     
-    return "\n\n".join(snippets)
\ No newline at end of file
+    style_guide = buf.getvalue()
+    _SNIPPET_CACHE[cache_key] = (signature, style_guide)
+    return style_guide
\ No newline at end of file
@@ -3,9 +3,12 @@ Validation utilities for code quality checks.
 Extracted from self_correction.py for better separation of concerns.
 """
 import ast
-from typing import List
+from typing import List, Optional, Tuple
 from pydantic import BaseModel, Field
 
+# compile() flags: stop after building the AST (what ast.parse does internally).
+# PyCF_TYPE_COMMENTS is deliberately left out, so "# type:" comments are not parsed.
+_ONLY_AST = ast.PyCF_ONLY_AST
 
 class ValidationResult(BaseModel):
     """Result of code validation."""
@@ -15,41 +18,65 @@ class ValidationResult(BaseModel):
     file_path: str = Field(description="Path of the validated file")
 
 
+class _ImportCollector(ast.NodeVisitor):
+    """Collects imported module names without descending into expressions."""
+    
+    # Imports are statements, so only statement-level nodes can contain them
+    _STATEMENT_NODES = (ast.stmt, ast.excepthandler, ast.match_case)
+    
+    def __init__(self):
+        self.names: List[str] = []
+    
+    def visit_Import(self, node: ast.Import) -> None:
+        self.names.extend(alias.name for alias in node.names)
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            self.names.append(node.module)
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, self._STATEMENT_NODES):
+                self.visit(child)
+
+
 class CodeValidator:
     """Validates generated Python code for syntax, structure, and best practices."""
     
     @staticmethod
-    def validate_syntax(code: str, file_path: str) -> ValidationResult:
-        """Validate Python syntax using AST."""
+    def _parse(code: str, file_path: str) -> Tuple[Optional[ast.AST], ValidationResult]:
+        """Parse code once, returning the AST (None on syntax error) and the syntax result."""
         try:
-            ast.parse(code)
-            return ValidationResult(
-                is_valid=True,
-                issues=[],
-                severity="info",
-                file_path=file_path
-            )
+            tree = compile(code, file_path or '<string>', 'exec', _ONLY_AST, dont_inherit=True)
         except SyntaxError as e:
-            return ValidationResult(
+            return None, ValidationResult(
                 is_valid=False,
-                issues=[f"Syntax Error at line {e.lineno}: {e.msg}"],
+                issues=["Syntax Error at line %s: %s" % (e.lineno, e.msg)],
                 severity="critical",
                 file_path=file_path
             )
+        return tree, ValidationResult(
+            is_valid=True,
+            issues=[],
+            severity="info",
+            file_path=file_path
+        )
+    
+    @classmethod
+    def validate_syntax(cls, code: str, file_path: str) -> ValidationResult:
+        """Validate Python syntax using AST."""
+        return cls._parse(code, file_path)[1]
     
     @staticmethod
-    def validate_imports(code: str, file_path: str) -> ValidationResult:
-        """Validate import statements."""
+    def validate_imports(code: str, file_path: str, tree: Optional[ast.AST] = None) -> ValidationResult:
+        """Validate import statements. Reuses `tree` when the caller already parsed the code."""
         issues = []
         try:
-            tree = ast.parse(code)
-            imports = []
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    imports.extend([alias.name for alias in node.names])
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        imports.append(node.module)
+            if tree is None:
+                tree = ast.parse(code)
+            collector = _ImportCollector()
+            collector.visit(tree)
+            imports = collector.names
             
             # Check for circular imports (basic check)
             if file_path and 'app/' in file_path:
@@ -82,26 +109,34 @@ class CodeValidator:
         """Validate FastAPI-specific patterns and best practices."""
         issues = []
         
+        # Route checks only apply to endpoint files; anything else only gets
+        # the path-independent Depends check, without scanning for routes
+        is_endpoint = 'endpoints/' in file_path or 'api/' in file_path
+        
         # Check for APIRouter in endpoint files
-        if 'endpoints/' in file_path or 'api/' in file_path:
+        if is_endpoint:
             if 'APIRouter' not in code:
                 issues.append("Endpoint file should use APIRouter")
             if '@router.' not in code and 'router = APIRouter()' in code:
                 issues.append("No route decorators found for defined router")
         
-        # Check for proper dependency injection
+        # Check for proper dependency injection ('Depends(' already implies 'Depends')
         if 'Depends(' in code:
-            if 'from fastapi import' not in code or 'Depends' not in code:
+            if 'from fastapi import' not in code:
                 issues.append("Using Depends but not importing it from fastapi")
         
-        # Check for response models in CRUD endpoints
-        if '@router.post' in code or '@router.get' in code:
-            if 'response_model=' not in code and '-> ' not in code:
-                issues.append("Endpoints should define response models or return types")
-        
-        # Check for proper status codes
-        if '@router.post' in code and 'status_code=201' not in code:
-            issues.append("POST endpoints should return 201 status code")
+        if is_endpoint:
+            # Scan for POST routes once; both checks below need it
+            has_post_route = '@router.post' in code
+            
+            # Check for response models in CRUD endpoints
+            if has_post_route or '@router.get' in code:
+                if 'response_model=' not in code and '-> ' not in code:
+                    issues.append("Endpoints should define response models or return types")
+            
+            # Check for proper status codes
+            if has_post_route and 'status_code=201' not in code:
+                issues.append("POST endpoints should return 201 status code")
         
         severity = "warning" if issues else "info"
         return ValidationResult(
@@ -114,16 +149,20 @@ class CodeValidator:
     @staticmethod
     def validate_sqlalchemy_patterns(code: str, file_path: str) -> ValidationResult:
         """Validate SQLAlchemy patterns."""
+        # Only model files are checked; return before touching the code otherwise
+        if not ('models/' in file_path and file_path.endswith('.py')):
+            return ValidationResult(is_valid=True, issues=[], severity="info", file_path=file_path)
+        
         issues = []
         
-        if 'models/' in file_path and file_path.endswith('.py'):
-            # Check for SQLAlchemy 2.0 syntax
-            if 'class ' in code and 'Base' in code:
-                if 'Mapped[' not in code and 'Column(' in code:
-                    issues.append("Use SQLAlchemy 2.0 syntax with Mapped[] instead of Column()")
-                
-                if 'mapped_column' not in code and 'Mapped[' in code:
-                    issues.append("Use mapped_column() with Mapped[] type hints")
+        # Check for SQLAlchemy 2.0 syntax
+        if 'class ' in code and 'Base' in code:
+            has_mapped = 'Mapped[' in code
+            if not has_mapped and 'Column(' in code:
+                issues.append("Use SQLAlchemy 2.0 syntax with Mapped[] instead of Column()")
+            
+            if has_mapped and 'mapped_column' not in code:
+                issues.append("Use mapped_column() with Mapped[] type hints")
         
         severity = "warning" if issues else "info"
         return ValidationResult(
@@ -133,20 +172,31 @@ class CodeValidator:
             file_path=file_path
         )
     
+    # Text-based pattern checks, dispatched in order by validate_all
+    _PATTERN_VALIDATORS = (
+        validate_fastapi_patterns.__func__,
+        validate_sqlalchemy_patterns.__func__,
+    )
+    
     @classmethod
     def validate_all(cls, code: str, file_path: str) -> List[ValidationResult]:
-        """Run all validators and return all results."""
-        validators = [
-            cls.validate_syntax,
-            cls.validate_imports,
-            cls.validate_fastapi_patterns,
-            cls.validate_sqlalchemy_patterns
-        ]
+        """
+        Run all validators and return the results that found problems.
+        The code is parsed only once; a syntax error is reported on its own
+        since the remaining checks would only repeat it.
+        """
+        tree, syntax_result = cls._parse(code, file_path)
+        if tree is None:
+            return [syntax_result]
         
         results = []
-        for validator in validators:
+        import_result = cls.validate_imports(code, file_path, tree=tree)
+        if not import_result.is_valid or import_result.issues:
+            results.append(import_result)
+        
+        for validator in cls._PATTERN_VALIDATORS:
             result = validator(code, file_path)
             if not result.is_valid or result.issues:
                 results.append(result)
         
-        return results
+        return results
\ No newline at end of file
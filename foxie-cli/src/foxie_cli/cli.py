@@ -1,48 +1,101 @@
 import typer
-import requests
 from typing_extensions import Annotated
-from typing import Optional
+from typing import Optional, Tuple
 import os
 import getpass
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
 from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from dotenv import load_dotenv, dotenv_values
+from rich.highlighter import NullHighlighter
 
-# Assuming your file writer utility is here
-from .utils.file_writer import write_files
-from .utils.template_generator import generate_pyproject_toml, generate_env_file
-# Assuming your Pydantic models for the response are here
-from .core.models import GeneratedCode, CodeFile
+# Config locations (following XDG Base Directory spec), resolved once at import.
+# Uses ~/.config/foxie/ on all platforms (works on Linux, macOS, and Windows 10+).
+CONFIG_DIR = Path.home() / ".config" / "foxie"
+CONFIG_FILE = CONFIG_DIR / "config.env"
 
-# Helper function to get the config directory path (following XDG Base Directory spec)
 def get_config_path() -> Path:
-    """
-    Get the configuration directory path following XDG Base Directory specification.
-    Uses ~/.config/foxie/ on all platforms (works on Linux, macOS, and Windows 10+).
-    """
-    return Path.home() / ".config" / "foxie"
+    """Get the configuration directory path (~/.config/foxie/)."""
+    return CONFIG_DIR
 
 def get_config_file() -> Path:
     """Get the path to the config file."""
-    return get_config_path() / "config.env"
+    return CONFIG_FILE
 
-# Load .env files to populate environment variables
-# This ensures os.getenv() can find GOOGLE_API_KEY from .env files
-load_dotenv()  # Loads .env in current directory
-foxie_config = get_config_file()
-if foxie_config.exists():
-    load_dotenv(foxie_config)  # Also load ~/.config/foxie/config.env
+@lru_cache(maxsize=1)
+def _ensure_env_loaded() -> None:
+    """
+    Load .env files to populate environment variables, once per process.
+    This ensures os.getenv() can find GOOGLE_API_KEY (and the FOXIE_* settings) from
+    .env files. Deferred until first needed so `foxie --help` does no file I/O.
+    """
+    from dotenv import load_dotenv
+    
+    load_dotenv()  # Loads .env in current directory
+    load_dotenv(CONFIG_FILE)  # Also load ~/.config/foxie/config.env (a missing file is a no-op)
 
 # --- Configuration ---
 # Define the URL of your backend service. Default is the deployed Render backend.
-BACKEND_URL = os.getenv("FOXIE_BACKEND_URL", "https://foxie-wsj6.onrender.com")
+DEFAULT_BACKEND_URL = "https://foxie-wsj6.onrender.com"
 
 # Scaffold timeout in seconds
-SCAFFOLD_TIMEOUT = int(os.getenv("FOXIE_SCAFFOLD_TIMEOUT", "300"))  # Default 5 minutes
+DEFAULT_SCAFFOLD_TIMEOUT = 300  # Default 5 minutes
+
+def get_backend_url() -> str:
+    """Backend URL, overridable with FOXIE_BACKEND_URL (environment or .env)."""
+    _ensure_env_loaded()
+    return os.getenv("FOXIE_BACKEND_URL", DEFAULT_BACKEND_URL)
+
+def get_scaffold_timeout() -> int:
+    """Scaffold timeout in seconds, overridable with FOXIE_SCAFFOLD_TIMEOUT."""
+    _ensure_env_loaded()
+    return int(os.getenv("FOXIE_SCAFFOLD_TIMEOUT", str(DEFAULT_SCAFFOLD_TIMEOUT)))
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Client-side check for --fields ("name:str,price:float"), so typos fail before the
+# backend round-trip. Types may use generics/unions/dotted names (list[int], str|None).
+_FIELD_PATTERN = r"\s*[A-Za-z_]\w*\s*:\s*[A-Za-z_][\w\[\]|. ]*"
+_FIELDS_RE = re.compile(rf"[\s,]*{_FIELD_PATTERN}(?:,[\s,]*{_FIELD_PATTERN})*[\s,]*")
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> "requests.Session":
+    """
+    Build the HTTP session used for backend calls on first use, then reuse it.
+    Keeps connections alive between requests. Only idempotent GETs are retried on
+    502/503/504; a /scaffold POST is never resent (each one is a billed LLM
+    generation), so its timeouts and errors surface unchanged. Failed connects,
+    where nothing reached the backend, are still retried for every method.
+    requests is imported here so commands that never hit the backend don't pay for it.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    retry = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,  # Let raise_for_status() report the final response
+    )
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
 
 console = Console()
+if console.color_system is None:
+    # Piped/CI output carries no styles, so the highlighter's regex pass over every
+    # printed line would be thrown away; markup is still parsed (and stripped) as before.
+    console.highlighter = NullHighlighter()
 app = typer.Typer(
     name="foxie",
     help="🦊 A smart AI-powered code scaffolding CLI for FastAPI"
@@ -55,9 +108,80 @@ scaffold_app = typer.Typer(
 app.add_typer(scaffold_app)
 
 
-def get_api_key() -> Optional[str]:
+@lru_cache(maxsize=8)
+def _read_env_key(path: str, signature: Tuple[int, int], key: str) -> Optional[str]:
+    """
+    Scan a .env file for a single key, returning its value or None if absent.
+    The (mtime_ns, size) signature is part of the cache key so edits are picked up.
+    Handles `export` prefixes and inline comments; the last assignment wins. Quoted
+    values (escapes, comments after the closing quote) are left to python-dotenv.
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    if key not in text:
+        return None  # Common case (e.g. a project .env without the key): no line scan
+    value = None
+    for line in text.split("\n"):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[7:].lstrip()
+        name, sep, raw = line.partition("=")
+        if not sep or name.strip() != key:
+            continue
+        raw = raw.strip()
+        if raw[:1] in ("'", '"'):
+            from dotenv import dotenv_values
+            return dotenv_values(path).get(key)
+        value = raw.split(" #", 1)[0].rstrip()
+    return value
+
+
+def _get_env_file_key(path: Path, key: str = "GOOGLE_API_KEY") -> Optional[str]:
+    """
+    Return `key` from a .env file, or None if the file or key does not exist.
+    Costs a single stat() per call; the file is only re-read when it changes.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return _read_env_key(str(path), (st.st_mtime_ns, st.st_size), key)
+
+
+def _save_api_key(api_key: str) -> None:
+    """
+    Write the API key to ~/.config/foxie/config.env in a single binary write.
+    The key goes to a temporary file that is then renamed over the config file,
+    so an interrupted save never leaves a truncated config behind.
+    """
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = CONFIG_FILE.with_name(CONFIG_FILE.name + ".tmp")
+    tmp_file.write_bytes(b"GOOGLE_API_KEY=" + api_key.encode("utf-8") + b"\n")
+    os.replace(tmp_file, CONFIG_FILE)
+
+
+def _ask(prompt: str, yes: bool = False, **kwargs) -> str:
+    """Prompt.ask, or its default without touching the terminal when `yes` is set."""
+    if yes:
+        return kwargs.get("default")
+    from rich.prompt import Prompt
+    return Prompt.ask(prompt, **kwargs)
+
+
+def _confirm(prompt: str, yes: bool = False, default: bool = False) -> bool:
+    """Confirm.ask, or `default` without touching the terminal when `yes` is set."""
+    if yes:
+        return default
+    from rich.prompt import Confirm
+    return Confirm.ask(prompt, default=default)
+
+
+@lru_cache(maxsize=1)
+def get_api_key(yes: bool = False) -> Optional[str]:
     """
     Get Google Gemini API key from environment or prompt user.
+    Resolved once per process; call get_api_key.cache_clear() after changing the key.
     Priority:
     1. GOOGLE_API_KEY environment variable (includes values loaded from .env files)
     2. .env file in current directory (fallback if not loaded)
@@ -67,16 +191,17 @@ def get_api_key() -> Optional[str]:
     Returns:
         API key string or None
     """
+    _ensure_env_loaded()
+    env_file = Path(".env")
+    
     # Check environment variable first (this will include values from .env files
-    # that were loaded by load_dotenv() at module level)
+    # loaded by _ensure_env_loaded() above)
     api_key = os.getenv("GOOGLE_API_KEY")
     if api_key:
         # Determine source for user feedback
-        env_file = Path(".env")
-        foxie_config = get_config_file()
-        if env_file.exists() and "GOOGLE_API_KEY" in dotenv_values(env_file):
+        if _get_env_file_key(env_file) is not None:
             console.print("[dim]✓ Using API key from .env file[/dim]")
-        elif foxie_config.exists() and "GOOGLE_API_KEY" in dotenv_values(foxie_config):
+        elif _get_env_file_key(CONFIG_FILE) is not None:
             console.print("[dim]✓ Using API key from config file[/dim]")
         else:
             console.print("[dim]✓ Using API key from environment[/dim]")
@@ -84,50 +209,41 @@ def get_api_key() -> Optional[str]:
     
     # Fallback: Check .env file in current directory directly
     # (in case load_dotenv() didn't work for some reason)
-    env_file = Path(".env")
-    if env_file.exists():
-        config = dotenv_values(env_file)
-        api_key = config.get("GOOGLE_API_KEY")
-        if api_key:
-            console.print("[dim]✓ Using API key from .env file[/dim]")
-            return api_key
+    api_key = _get_env_file_key(env_file)
+    if api_key:
+        console.print("[dim]✓ Using API key from .env file[/dim]")
+        return api_key
     
     # Fallback: Check ~/.config/foxie/config.env directly
-    foxie_config = get_config_file()
-    if foxie_config.exists():
-        config = dotenv_values(foxie_config)
-        api_key = config.get("GOOGLE_API_KEY")
-        if api_key:
-            console.print("[dim]✓ Using API key from config file[/dim]")
-            return api_key
+    api_key = _get_env_file_key(CONFIG_FILE)
+    if api_key:
+        console.print("[dim]✓ Using API key from config file[/dim]")
+        return api_key
     
     # Prompt user
-    console.print("\n[yellow]⚠️  Google Gemini API Key Required[/yellow]")
-    console.print("[dim]No API key found in environment or config files.[/dim]\n")
-    
-    console.print("[cyan]You can get your API key from:[/cyan]")
-    console.print("[cyan]https://makersuite.google.com/app/apikey[/cyan]\n")
+    console.print(
+        "\n[yellow]⚠️  Google Gemini API Key Required[/yellow]\n"
+        "[dim]No API key found in environment or config files.[/dim]\n\n"
+        "[cyan]You can get your API key from:[/cyan]\n"
+        "[cyan]https://makersuite.google.com/app/apikey[/cyan]\n"
+    )
     
     api_key = getpass.getpass("🔑 Enter your Google Gemini API key (hidden): ")
     
     if api_key:
         # Offer to save it
-        config_file = get_config_file()
-        save_it = Confirm.ask(f"\n💾 Save this API key to {config_file} for future use?", default=True)
+        save_it = _confirm(f"\n💾 Save this API key to {CONFIG_FILE} for future use?", yes=yes, default=True)
         if save_it:
-            config_dir = get_config_path()
-            config_dir.mkdir(parents=True, exist_ok=True)
-            
-            with open(config_file, "w") as f:
-                f.write(f"GOOGLE_API_KEY={api_key}\n")
-            
-            console.print(f"[green]✓ API key saved to {config_file}[/green]")
+            _save_api_key(api_key)
+            console.print(f"[green]✓ API key saved to {CONFIG_FILE}[/green]")
     
     return api_key
 
 
-def interactive_scaffold():
-    """Interactive mode - prompts user for all inputs."""
+def interactive_scaffold(yes: bool = False):
+    """Interactive mode - prompts user for all inputs (or takes every default when `yes` is set)."""
+    from rich.panel import Panel
+    
     console.print(Panel.fit(
         "[bold cyan]🦊 Foxie AI Code Scaffolding[/bold cyan]\n"
         "Generate production-ready FastAPI CRUD features with AI",
@@ -135,55 +251,66 @@ def interactive_scaffold():
     ))
     
     # Get API key first
-    api_key = get_api_key()
+    api_key = get_api_key(yes)
     if not api_key:
         console.print("[red]❌ API key is required to use Foxie[/red]")
         raise typer.Exit(code=1)
     
     # Project name
-    project_name = Prompt.ask(
+    project_name = _ask(
         "\n[cyan]📦 Project name[/cyan]",
+        yes=yes,
         default="my-fastapi-project"
     )
     
     # Resource name
-    resource = Prompt.ask(
+    resource = _ask(
         "[cyan]🏷️  Resource name[/cyan] (e.g., product, user, order)",
+        yes=yes,
         default="product"
     )
     
     # Fields
-    console.print("\n[cyan]📝 Define your fields[/cyan]")
-    console.print("[dim]Format: field_name:type (comma-separated)[/dim]")
-    console.print("[dim]Example: name:str,price:float,description:str,stock:int[/dim]")
+    console.print(
+        "\n[cyan]📝 Define your fields[/cyan]\n"
+        "[dim]Format: field_name:type (comma-separated)[/dim]\n"
+        "[dim]Example: name:str,price:float,description:str,stock:int[/dim]"
+    )
     
-    fields = Prompt.ask(
+    fields = _ask(
         "\n[cyan]Fields[/cyan]",
+        yes=yes,
         default="name:str,price:float,description:str"
     )
     
     # Database type
-    console.print("\n[cyan]🗄️  Database Type[/cyan]")
-    console.print("[dim]Choose your database system:[/dim]")
-    console.print("[bold]1. SQL[/bold] (SQLAlchemy with PostgreSQL/MySQL/SQLite)")
-    console.print("[bold]2. MongoDB[/bold] (NoSQL with Beanie ODM)")
+    console.print(
+        "\n[cyan]🗄️  Database Type[/cyan]\n"
+        "[dim]Choose your database system:[/dim]\n"
+        "[bold]1. SQL[/bold] (SQLAlchemy with PostgreSQL/MySQL/SQLite)\n"
+        "[bold]2. MongoDB[/bold] (NoSQL with Beanie ODM)"
+    )
     
-    db_choice = Prompt.ask(
+    db_choice = _ask(
         "\n[yellow]Select database type[/yellow]",
+        yes=yes,
         choices=["1", "2"],
         default="1"
     )
     database_type = "sql" if db_choice == "1" else "mongodb"
     
     # Authentication
-    console.print("\n[cyan]🔐 Authentication[/cyan]")
-    console.print("[dim]Enable authentication? This will generate:[/dim]")
-    console.print("[dim]  - User model with password hashing[/dim]")
-    console.print("[dim]  - Registration and login endpoints[/dim]")
-    console.print("[dim]  - JWT token generation[/dim]")
+    console.print(
+        "\n[cyan]🔐 Authentication[/cyan]\n"
+        "[dim]Enable authentication? This will generate:[/dim]\n"
+        "[dim]  - User model with password hashing[/dim]\n"
+        "[dim]  - Registration and login endpoints[/dim]\n"
+        "[dim]  - JWT token generation[/dim]"
+    )
     
-    enable_auth = Confirm.ask(
+    enable_auth = _confirm(
         "[yellow]Enable authentication?[/yellow]",
+        yes=yes,
         default=False
     )
     
@@ -198,6 +325,149 @@ def interactive_scaffold():
     }
 
 
+def _status(message: str):
+    """
+    Spinner for long waits. When stdout is not a terminal (CI, docker logs, redirects)
+    the message is printed once instead, so no refresh thread runs while we wait.
+    On a terminal the spinner redraws a few times a second rather than Rich's default 12.5.
+    """
+    if console.is_terminal:
+        return console.status(message, spinner="dots", refresh_per_second=4)
+    console.print(message)
+    return nullcontext()
+
+
+def _check_fields(fields: str):
+    """Exit with an error if `fields` is not a comma-separated list of name:type pairs."""
+    if not _FIELDS_RE.fullmatch(fields):
+        console.print(f"[red]❌ Error: Invalid fields '{fields}'. Expected comma-separated name:type pairs, e.g. \"name:str,price:float\".[/red]")
+        raise typer.Exit(code=1)
+
+
+def _request_generation(request_data: dict, show_status: bool = True) -> "GeneratedCode":
+    """
+    POST one scaffold request to the backend and return the validated GeneratedCode.
+    Failures are reported on the console and raise typer.Exit(1).
+    Pass show_status=False when the caller already shows its own spinner.
+    """
+    # Imported here so `foxie --help` and `foxie config` skip the HTTP and model stack
+    import requests
+    from .core.models import GeneratedCode
+    
+    scaffold_endpoint = f"{get_backend_url()}/scaffold"
+    scaffold_timeout = get_scaffold_timeout()
+    # Serialize once; the same bytes are sent again if the adapter retries
+    body = json.dumps(request_data).encode("utf-8")
+    generated_code: GeneratedCode = None
+    try:
+        # Use a spinner while waiting for the backend
+        with _status("[bold green]🤖 AI is generating your code...") if show_status else nullcontext():
+            response = _get_session().post(
+                scaffold_endpoint, 
+                data=body, 
+                headers=_JSON_HEADERS,
+                timeout=scaffold_timeout
+            )
+            response.raise_for_status() # Check for HTTP errors
+            
+            # Check if response is HTML (error page) instead of JSON
+            content_type = response.headers.get('content-type', '').lower()
+            if 'text/html' in content_type:
+                console.print(f"\n[red]❌ Backend service returned an HTML error page[/red]")
+                console.print("[yellow]    The backend may be down or experiencing issues.[/yellow]")
+                console.print("[dim]    Please check the backend status and try again later.[/dim]")
+                raise typer.Exit(code=1)
+            
+            # Response is GeneratedCode; validate the raw bytes in one pass
+            # (no intermediate dict from response.json())
+            generated_code = GeneratedCode.model_validate_json(response.content)
+            
+        typer.secho("\n✅ Received generated code from backend!", fg=typer.colors.GREEN)
+
+    except requests.exceptions.ConnectionError:
+        console.print(f"\n[red]❌ Error: Could not connect to backend service.[/red]")
+        console.print("[yellow]    Please check your internet connection or backend configuration.[/yellow]")
+        console.print("[dim]    For local development, ensure the backend is running and FOXIE_BACKEND_URL is set correctly.[/dim]")
+        raise typer.Exit(code=1)
+    except requests.exceptions.Timeout:
+        console.print(f"\n[red]❌ Error: Request to backend timed out after {scaffold_timeout} seconds.[/red]")
+        console.print("[yellow]    The AI generation is taking longer than expected.[/yellow]")
+        console.print("[dim]    Tip: You can increase the timeout by setting FOXIE_SCAFFOLD_TIMEOUT environment variable[/dim]")
+        console.print(f"[dim]    Current timeout: {scaffold_timeout}s. Try: export FOXIE_SCAFFOLD_TIMEOUT=300[/dim]")
+        raise typer.Exit(code=1)
+    except requests.exceptions.HTTPError as e:
+        status_code = e.response.status_code
+        
+        # Handle 502 Bad Gateway (service unavailable)
+        if status_code == 502:
+            console.print(f"\n[red]❌ Backend service is currently unavailable (502 Bad Gateway)[/red]")
+            console.print("[yellow]    The backend service may be starting up or experiencing issues.[/yellow]")
+            console.print("[dim]    Please wait a moment and try again. If the problem persists, check the backend status.[/dim]")
+            raise typer.Exit(code=1)
+        
+        # Try to get error detail, but filter out HTML responses
+        error_detail = e.response.text
+        if error_detail and not error_detail.strip().startswith('<!DOCTYPE') and not error_detail.strip().startswith('<html'):
+            # It's a JSON/text error, show it
+            console.print(f"\n[red]❌ Backend Error ({status_code}):[/red]")
+            console.print(f"[red]{error_detail[:500]}[/red]")  # Limit length
+        else:
+            # It's HTML (like Render error page), show generic message
+            console.print(f"\n[red]❌ Backend Error ({status_code}):[/red]")
+            console.print("[yellow]    The backend service returned an error. Please try again later.[/yellow]")
+        
+        raise typer.Exit(code=1)
+    except Exception as e: # Catch Pydantic validation errors or other issues
+        error_msg = str(e)
+        # Check if it's a JSON decode error (likely HTML response)
+        if "Expecting value" in error_msg or "JSON" in error_msg:
+            console.print(f"\n[red]❌ Backend service returned an invalid response[/red]")
+            console.print("[yellow]    The backend may be experiencing issues or returning an error page.[/yellow]")
+            console.print("[dim]    Please try again in a moment. If the problem persists, check the backend status.[/dim]")
+        else:
+            console.print(f"\n[red]❌ Error processing backend response: {e}[/red]")
+        raise typer.Exit(code=1)
+    
+    if generated_code is None:
+        console.print("\n[red]❌ Error: No code was generated by the backend.[/red]")
+        raise typer.Exit(code=1)
+    
+    return generated_code
+
+
+def _write_project(generated_code: "GeneratedCode", project_name: str, database_type: str, enable_auth: bool):
+    """Write the generated code plus the static pyproject.toml and .env into project_name."""
+    from .utils.file_writer import write_files
+    from .utils.template_generator import generate_pyproject_toml, generate_env_file
+    
+    write_files(generated_code, base_dir=project_name)
+
+    # Generate static template files (pyproject.toml and .env)
+    console.print("\n[bold cyan]📝 Generating configuration files...[/bold cyan]")
+
+    pyproject_path = Path(project_name) / "pyproject.toml"
+    generate_pyproject_toml(
+        project_name=project_name,
+        database_type=database_type,
+        enable_auth=enable_auth,
+        output_path=pyproject_path
+    )
+    console.print(f"  ✅ Created: {pyproject_path}")
+
+    env_path = Path(project_name) / ".env"
+    generate_env_file(
+        database_type=database_type,
+        output_path=env_path
+    )
+    console.print(f"  ✅ Created: {env_path}")
+
+    console.print(f"\n[bold bright_green]🎉 Successfully scaffolded project '{project_name}'![/bold bright_green]")
+
+    # Show file count (including the 2 template files)
+    total_files = len(generated_code.files) + 2
+    console.print(f"[green]📄 Generated {total_files} files ({len(generated_code.files)} code files + 2 config files)[/green]")
+
+
 @scaffold_app.command(
     "fastapi-crud",
     help="Scaffolds a full CRUD feature via the backend AI service."
@@ -223,6 +493,10 @@ def scaffold_fastapi_crud(
         "--enable-auth",
         help="Enable authentication (generates User model, auth endpoints, JWT)"
     )] = False,
+    yes: Annotated[bool, typer.Option(
+        "--yes", "-y",
+        help="Accept the default answer for every prompt (useful in scripts)."
+    )] = False,
 ):
     """
     Sends a request to the Foxie backend to generate code.
@@ -230,13 +504,14 @@ def scaffold_fastapi_crud(
     """
     # If no arguments provided, use interactive mode
     if not project_name and not resource and not fields:
-        params = interactive_scaffold()
+        params = interactive_scaffold(yes=yes)
         project_name = params["project_name"]
         resource = params["resource"]
         fields = params["fields"]
         database_type = params["database_type"]
         enable_auth = params["enable_auth"]
         api_key = params["api_key"]
+        _check_fields(fields)
     else:
         # Validate required parameters
         if not project_name or not resource or not fields:
@@ -244,8 +519,11 @@ def scaffold_fastapi_crud(
             console.print("\n[yellow]💡 Tip: Run without options for interactive mode[/yellow]")
             raise typer.Exit(code=1)
         
+        # Reject malformed fields before prompting for a key or calling the backend
+        _check_fields(fields)
+        
         # Get API key
-        api_key = get_api_key()
+        api_key = get_api_key(yes)
         if not api_key:
             console.print("[red]❌ API key is required to use Foxie[/red]")
             raise typer.Exit(code=1)
@@ -274,163 +552,181 @@ def scaffold_fastapi_crud(
         "enable_auth": enable_auth,
         "api_key": api_key
     }
-    scaffold_endpoint = f"{BACKEND_URL}/scaffold"
     typer.echo(f"\n⚡ Generating code...")
 
     # --- Call Backend API ---
-    generated_code: GeneratedCode = None
-    try:
-        # Use a spinner while waiting for the backend
-        with console.status("[bold green]🤖 AI is generating your code...", spinner="dots") as status:
-            response = requests.post(
-                scaffold_endpoint, 
-                json=request_data, 
-                timeout=SCAFFOLD_TIMEOUT
-            )
-            response.raise_for_status() # Check for HTTP errors
-            
-            # Check if response is HTML (error page) instead of JSON
-            content_type = response.headers.get('content-type', '').lower()
-            if 'text/html' in content_type:
-                console.print(f"\n[red]❌ Backend service returned an HTML error page[/red]")
-                console.print("[yellow]    The backend may be down or experiencing issues.[/yellow]")
-                console.print("[dim]    Please check the backend status and try again later.[/dim]")
-                raise typer.Exit(code=1)
-            
-            response_data = response.json()
-            
-            # Response is GeneratedCode
-            generated_code = GeneratedCode(**response_data)
-            
-            status.stop()
-            
-        typer.secho("\n✅ Received generated code from backend!", fg=typer.colors.GREEN)
-
-    except requests.exceptions.ConnectionError:
-        console.print(f"\n[red]❌ Error: Could not connect to backend service.[/red]")
-        console.print("[yellow]    Please check your internet connection or backend configuration.[/yellow]")
-        console.print("[dim]    For local development, ensure the backend is running and FOXIE_BACKEND_URL is set correctly.[/dim]")
-        raise typer.Exit(code=1)
-    except requests.exceptions.Timeout:
-        console.print(f"\n[red]❌ Error: Request to backend timed out after {SCAFFOLD_TIMEOUT} seconds.[/red]")
-        console.print("[yellow]    The AI generation is taking longer than expected.[/yellow]")
-        console.print("[dim]    Tip: You can increase the timeout by setting FOXIE_SCAFFOLD_TIMEOUT environment variable[/dim]")
-        console.print(f"[dim]    Current timeout: {SCAFFOLD_TIMEOUT}s. Try: export FOXIE_SCAFFOLD_TIMEOUT=300[/dim]")
-        raise typer.Exit(code=1)
-    except requests.exceptions.HTTPError as e:
-        status_code = e.response.status_code
-        
-        # Handle 502 Bad Gateway (service unavailable)
-        if status_code == 502:
-            console.print(f"\n[red]❌ Backend service is currently unavailable (502 Bad Gateway)[/red]")
-            console.print("[yellow]    The backend service may be starting up or experiencing issues.[/yellow]")
-            console.print("[dim]    Please wait a moment and try again. If the problem persists, check the backend status.[/dim]")
-            raise typer.Exit(code=1)
-        
-        # Try to get error detail, but filter out HTML responses
-        error_detail = e.response.text
-        if error_detail and not error_detail.strip().startswith('<!DOCTYPE') and not error_detail.strip().startswith('<html'):
-            # It's a JSON/text error, show it
-            console.print(f"\n[red]❌ Backend Error ({status_code}):[/red]")
-            console.print(f"[red]{error_detail[:500]}[/red]")  # Limit length
-        else:
-            # It's HTML (like Render error page), show generic message
-            console.print(f"\n[red]❌ Backend Error ({status_code}):[/red]")
-            console.print("[yellow]    The backend service returned an error. Please try again later.[/yellow]")
-        
-        raise typer.Exit(code=1)
-    except Exception as e: # Catch Pydantic validation errors or other issues
-        error_msg = str(e)
-        # Check if it's a JSON decode error (likely HTML response)
-        if "Expecting value" in error_msg or "JSON" in error_msg:
-            console.print(f"\n[red]❌ Backend service returned an invalid response[/red]")
-            console.print("[yellow]    The backend may be experiencing issues or returning an error page.[/yellow]")
-            console.print("[dim]    Please try again in a moment. If the problem persists, check the backend status.[/dim]")
-        else:
-            console.print(f"\n[red]❌ Error processing backend response: {e}[/red]")
-        raise typer.Exit(code=1)
-    
-    if generated_code is None:
-        console.print("\n[red]❌ Error: No code was generated by the backend.[/red]")
-        raise typer.Exit(code=1)
+    generated_code = _request_generation(request_data)
 
     # --- Write Files ---
     try:
-        write_files(generated_code, base_dir=project_name)
-        
-        # Generate static template files (pyproject.toml and .env)
-        console.print("\n[bold cyan]📝 Generating configuration files...[/bold cyan]")
-        
-        pyproject_path = os.path.join(project_name, "pyproject.toml")
-        generate_pyproject_toml(
-            project_name=project_name,
-            database_type=database_type,
-            enable_auth=enable_auth,
-            output_path=pyproject_path
-        )
-        console.print(f"  ✅ Created: {pyproject_path}")
-        
-        env_path = os.path.join(project_name, ".env")
-        generate_env_file(
-            database_type=database_type,
-            output_path=env_path
-        )
-        console.print(f"  ✅ Created: {env_path}")
-        
-        console.print(f"\n[bold bright_green]🎉 Successfully scaffolded project '{project_name}'![/bold bright_green]")
-        
-        # Show file count (including the 2 template files)
-        total_files = len(generated_code.files) + 2
-        console.print(f"[green]📄 Generated {total_files} files ({len(generated_code.files)} code files + 2 config files)[/green]")
+        _write_project(generated_code, project_name, database_type, enable_auth)
         
         # --- Setup Instructions ---
-        console.print("\n[bold cyan]📋 Next Steps:[/bold cyan]")
-        
-        console.print(f"\n[bold]1. Navigate to your project:[/bold]")
-        console.print(f"   [cyan]cd {project_name}[/cyan]")
-        
-        console.print(f"\n[bold]2. Setup environment:[/bold]")
-        console.print(f"   [cyan]uv venv[/cyan]")
-        console.print(f"   [cyan].venv\\Scripts\\activate[/cyan]  [dim](Windows)[/dim]")
-        console.print(f"   [cyan]source .venv/bin/activate[/cyan]  [dim](Linux/macOS)[/dim]")
-        
-        console.print(f"\n[bold]3. Install dependencies:[/bold]")
-        console.print(f"   [cyan]uv pip install -e .[/cyan]")
+        # Collected into one markup string so Rich renders the block in a single print
+        steps = [
+            "\n[bold cyan]📋 Next Steps:[/bold cyan]",
+            "\n[bold]1. Navigate to your project:[/bold]",
+            f"   [cyan]cd {project_name}[/cyan]",
+            "\n[bold]2. Setup environment:[/bold]",
+            "   [cyan]uv venv[/cyan]",
+            "   [cyan].venv\\Scripts\\activate[/cyan]  [dim](Windows)[/dim]",
+            "   [cyan]source .venv/bin/activate[/cyan]  [dim](Linux/macOS)[/dim]",
+            "\n[bold]3. Install dependencies:[/bold]",
+            "   [cyan]uv pip install -e .[/cyan]",
+        ]
         
         # Database-specific setup instructions
         if database_type == "sql":
-            console.print(f"\n[bold]4. Configure database (optional):[/bold]")
-            console.print(f"   [cyan]# SQLite is configured by default in .env[/cyan]")
-            console.print(f"   [cyan]# For PostgreSQL: Update DATABASE_URL in .env file[/cyan]")
+            steps += [
+                "\n[bold]4. Configure database (optional):[/bold]",
+                "   [cyan]# SQLite is configured by default in .env[/cyan]",
+                "   [cyan]# For PostgreSQL: Update DATABASE_URL in .env file[/cyan]",
+            ]
         else:  # mongodb
-            console.print(f"\n[bold]4. Configure database:[/bold]")
-            console.print(f"   [cyan]# Update DATABASE_URL in .env file if needed[/cyan]")
-            console.print(f"   [cyan]# Default: mongodb://localhost:27017[/cyan]")
+            steps += [
+                "\n[bold]4. Configure database:[/bold]",
+                "   [cyan]# Update DATABASE_URL in .env file if needed[/cyan]",
+                "   [cyan]# Default: mongodb://localhost:27017[/cyan]",
+            ]
         
         if enable_auth:
-            console.print(f"\n[bold]5. Configure authentication:[/bold]")
-            console.print(f"   [cyan]# Update SECRET_KEY in .env file for production[/cyan]")
-            console.print(f"   [cyan]# Default key is provided for development only[/cyan]")
-        
-        console.print(f"\n[bold]6. Run your FastAPI app:[/bold]")
-        console.print(f"   [cyan]uvicorn app.main:app --reload[/cyan]")
+            steps += [
+                "\n[bold]5. Configure authentication:[/bold]",
+                "   [cyan]# Update SECRET_KEY in .env file for production[/cyan]",
+                "   [cyan]# Default key is provided for development only[/cyan]",
+            ]
         
-        console.print(f"\n[dim]💡 Tip: Your API will be available at http://localhost:8000/docs[/dim]")
+        steps += [
+            "\n[bold]6. Run your FastAPI app:[/bold]",
+            "   [cyan]uvicorn app.main:app --reload[/cyan]",
+            "\n[dim]💡 Tip: Your API will be available at http://localhost:8000/docs[/dim]",
+        ]
         
         if enable_auth:
-            console.print(f"\n[dim]🔐 Authentication: Use /api/v1/auth/register and /api/v1/auth/login endpoints[/dim]")
+            steps.append("\n[dim]🔐 Authentication: Use /api/v1/auth/register and /api/v1/auth/login endpoints[/dim]")
+        
+        console.print("\n".join(steps))
 
     except Exception as e:
         console.print(f"\n[red]❌ An error occurred while writing files: {e}[/red]")
         raise typer.Exit(code=1)
 
 
+@scaffold_app.command(
+    "fastapi-crud-batch",
+    help="Scaffolds several CRUD features from a JSON spec file in one run."
+)
+def scaffold_fastapi_crud_batch(
+    spec: Annotated[Path, typer.Option(
+        "--spec", "-s",
+        help='JSON file with a list of scaffolds, e.g. [{"project_name": "shop", "resource": "product", "fields": "name:str,price:float"}].'
+    )],
+    yes: Annotated[bool, typer.Option(
+        "--yes", "-y",
+        help="Accept the default answer for every prompt (useful in scripts)."
+    )] = False,
+):
+    """
+    Scaffolds every entry of a JSON spec file in a single process.
+    Each entry needs project_name, resource and fields; database_type ('sql' or 'mongodb')
+    and enable_auth are optional. Every entry must use its own project_name.
+    """
+    try:
+        entries = json.loads(spec.read_bytes())
+    except (OSError, ValueError) as e:
+        console.print(f"[red]❌ Error: Could not read spec file {spec}: {e}[/red]")
+        raise typer.Exit(code=1)
+    
+    if not isinstance(entries, list) or not entries:
+        console.print("[red]❌ Error: The spec file must contain a non-empty JSON list of scaffolds.[/red]")
+        raise typer.Exit(code=1)
+    
+    # Get API key (shared by all entries)
+    api_key = get_api_key(yes)
+    if not api_key:
+        console.print("[red]❌ API key is required to use Foxie[/red]")
+        raise typer.Exit(code=1)
+    
+    # Validate every entry before calling the backend
+    batch = []
+    project_dirs = set()
+    for index, entry in enumerate(entries, start=1):
+        if not isinstance(entry, dict) or not all(
+            isinstance(entry.get(key), str) and entry[key] for key in ("project_name", "resource", "fields")
+        ):
+            console.print(f"[red]❌ Error: Entry {index} needs project_name, resource and fields as non-empty strings.[/red]")
+            raise typer.Exit(code=1)
+        
+        # Entries are generated concurrently, so two of them must never share a directory
+        project_dir = os.path.normpath(entry["project_name"])
+        if project_dir in project_dirs:
+            console.print(f"[red]❌ Error: Entry {index}: project_name '{entry['project_name']}' is already used by another entry.[/red]")
+            raise typer.Exit(code=1)
+        project_dirs.add(project_dir)
+        
+        if not _FIELDS_RE.fullmatch(entry["fields"]):
+            console.print(f"[red]❌ Error: Entry {index}: invalid fields '{entry['fields']}'. Expected comma-separated name:type pairs.[/red]")
+            raise typer.Exit(code=1)
+        
+        database_type = entry.get("database_type") or "sql"
+        if database_type not in ["sql", "mongodb"]:
+            console.print(f"[red]❌ Error: Entry {index}: database_type must be 'sql' or 'mongodb'[/red]")
+            raise typer.Exit(code=1)
+        
+        batch.append({
+            "project_name": entry["project_name"],
+            "resource": entry["resource"],
+            "fields_str": entry["fields"],
+            "database_type": database_type,
+            "enable_auth": bool(entry.get("enable_auth", False)),
+            "api_key": api_key
+        })
+    
+    typer.echo(f"\n⚡ Generating code for {len(batch)} features...")
+    
+    def generate(request_data: dict):
+        # A failed entry is already reported on the console; keep going with the rest
+        try:
+            return _request_generation(request_data, show_status=False)
+        except typer.Exit:
+            return None
+    
+    # The backend calls are independent and mostly wait on the LLM, so they run
+    # concurrently over the pooled session under a single spinner. The session is
+    # built here, before the workers start, so they all share the one instance.
+    _get_session()
+    with _status(f"[bold green]🤖 AI is generating {len(batch)} features..."):
+        with ThreadPoolExecutor(max_workers=min(4, len(batch))) as executor:
+            results = list(executor.map(generate, batch))
+    
+    failed = []
+    for request_data, generated_code in zip(batch, results):
+        project_name = request_data["project_name"]
+        if generated_code is None:
+            failed.append(project_name)
+            continue
+        try:
+            _write_project(generated_code, project_name, request_data["database_type"], request_data["enable_auth"])
+        except Exception as e:
+            console.print(f"\n[red]❌ An error occurred while writing files for '{project_name}': {e}[/red]")
+            failed.append(project_name)
+    
+    if failed:
+        console.print(f"\n[red]❌ {len(failed)} of {len(batch)} scaffolds failed: {', '.join(failed)}[/red]")
+        raise typer.Exit(code=1)
+    
+    console.print(f"\n[bold bright_green]🎉 Successfully scaffolded {len(batch)} projects![/bold bright_green]")
+    console.print("[dim]💡 Tip: Each project is set up like a single `foxie scaffold fastapi-crud` run (cd, uv venv, uv pip install -e .)[/dim]")
+
+
 @app.command("config")
 def configure_api_key():
     """
     Configure Google Gemini API key for Foxie.
     Saves the key to ~/.config/foxie/config.env for future use.
     """
+    from rich.panel import Panel
+    
     console.print(Panel.fit(
         "[bold cyan]🔑 Configure Foxie API Key[/bold cyan]\n"
         "Set up your Google Gemini API key",
@@ -447,14 +743,10 @@ def configure_api_key():
         raise typer.Exit(code=1)
     
     # Save to ~/.config/foxie/config.env
-    config_dir = get_config_path()
-    config_dir.mkdir(parents=True, exist_ok=True)
-    config_file = get_config_file()
-    
-    with open(config_file, "w") as f:
-        f.write(f"GOOGLE_API_KEY={api_key}\n")
+    _save_api_key(api_key)
+    get_api_key.cache_clear()
     
-    console.print(f"\n[green]✓ API key saved to {config_file}[/green]")
+    console.print(f"\n[green]✓ API key saved to {CONFIG_FILE}[/green]")
     console.print("\n[dim]You can now use Foxie without entering your API key each time.[/dim]")
 
 
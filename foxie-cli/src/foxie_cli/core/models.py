@@ -1,8 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List
 
+# The CLI only reads the backend's response, so the models are immutable.
+_RESPONSE_CONFIG = ConfigDict(frozen=True)
+
 class CodeFile(BaseModel):
     """Represents a single generated code file."""
+    model_config = _RESPONSE_CONFIG
+
     file_path: str = Field(
         ..., 
         description="The full path for the file, e.g., 'app/models/product.py'."
@@ -18,6 +23,8 @@ class CodeFile(BaseModel):
 
 class GeneratedCode(BaseModel):
     """Represents the complete set of files for a scaffolded feature."""
+    model_config = _RESPONSE_CONFIG
+
     files: List[CodeFile] = Field(
         ...,
         description="A list of all the code files required for the feature."
@@ -1,7 +1,10 @@
 import os
 import typer
 import subprocess
-from foxie_cli.core.models import GeneratedCode
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Tuple
+from foxie_cli.core.models import CodeFile, GeneratedCode
 import sys # Needed to find python executable
 
 def unfence_code(code_string: str) -> str:
@@ -21,8 +24,11 @@ def unfence_code(code_string: str) -> str:
     # If no fences detected or structure is wrong, return original
     return code_string
 
-def format_python_file(file_path: str):
-    """Runs the 'black' code formatter using the absolute path."""
+def _run_black(file_path: str) -> Tuple[bool, Optional[Tuple[str, str]]]:
+    """
+    Run black on file_path without printing (safe to call from worker threads).
+    Returns (formatted, problem), where problem is a (message, color) pair to report or None.
+    """
     try:
         # Get the absolute path to the python executable running this script
         # This helps ensure black is run from the correct venv
@@ -37,23 +43,56 @@ def format_python_file(file_path: str):
             text=True,           # Decode output as text
             cwd=os.path.dirname(file_path) # Run from file's directory
         )
-        return True
+        return True, None
     except subprocess.CalledProcessError as e:
-        # Black returned a non-zero exit code. Print stderr.
+        # Black returned a non-zero exit code. Report stderr.
         error_message = e.stderr.strip() if e.stderr else "No error output from black."
-        typer.secho(f"  ❌ Black failed for {os.path.basename(file_path)}. Error: {error_message}", fg=typer.colors.RED)
-        return False
+        return False, (f"  ❌ Black failed for {os.path.basename(file_path)}. Error: {error_message}", typer.colors.RED)
     except FileNotFoundError:
         # This might happen if 'python' or 'black' module isn't found
-        typer.secho(f"  ⚠️ Warning: Could not find Python executable or 'black' module. Skipping formatting for {file_path}.", fg=typer.colors.YELLOW)
-        return False
+        return False, (f"  ⚠️ Warning: Could not find Python executable or 'black' module. Skipping formatting for {file_path}.", typer.colors.YELLOW)
     except Exception as e: # Catch any other unexpected errors
-         typer.secho(f"  ❌ Unknown error during formatting {os.path.basename(file_path)}: {e}", fg=typer.colors.RED)
-         return False
+         return False, (f"  ❌ Unknown error during formatting {os.path.basename(file_path)}: {e}", typer.colors.RED)
+
+def format_python_file(file_path: str):
+    """Runs the 'black' code formatter using the absolute path."""
+    formatted, problem = _run_black(file_path)
+    if problem is not None:
+        typer.secho(problem[0], fg=problem[1])
+    return formatted
+
+def _write_one(
+    code_file: CodeFile, base_dir: str
+) -> Tuple[str, Optional[OSError], Optional[bool], Optional[Tuple[str, str]]]:
+    """
+    Write (and format, for .py files) a single generated file.
+    Runs in a worker thread, so it reports back instead of printing:
+    returns (file_path, error, formatted, format_problem), where formatted is None for
+    non-Python files and format_problem is black's (message, color) to report, if any.
+    """
+    # Directories were created up front by write_files
+    file_path = os.path.join(base_dir, code_file.file_path)
+
+    try:
+        clean_content = unfence_code(code_file.content)
+
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(clean_content)
+    except OSError as e:
+        return file_path, e, None, None
+
+    formatted = None
+    format_problem = None
+    if file_path.endswith(".py"):
+        # Use the absolute path for formatting
+        formatted, format_problem = _run_black(os.path.abspath(file_path))
+    return file_path, None, formatted, format_problem
 
 def write_files(generated_code: GeneratedCode, base_dir: str = "."):
     """
     Writes the generated code files, unfencing and formatting them.
+    Files are written and formatted in parallel (each black run is its own
+    subprocess); results are reported in the original file order.
     """
     typer.secho("\n📝 Writing generated files to disk...", fg=typer.colors.BLUE)
 
@@ -61,37 +100,44 @@ def write_files(generated_code: GeneratedCode, base_dir: str = "."):
         typer.secho("Warning: No files were generated by the AI.", fg=typer.colors.YELLOW)
         return
 
-    for code_file in generated_code.files:
-        # Ensure base_dir exists first
-        os.makedirs(base_dir, exist_ok=True)
-        
-        file_path = os.path.join(base_dir, code_file.file_path)
-        directory = os.path.dirname(file_path)
-
-        try:
-            if directory:
+    # Create each distinct directory exactly once (base_dir first) instead of once per file.
+    # A failure here surfaces as the per-file OSError when the write is attempted.
+    directories = dict.fromkeys(
+        [base_dir] + [os.path.dirname(os.path.join(base_dir, f.file_path)) for f in generated_code.files]
+    )
+    for directory in directories:
+        if directory:
+            try:
                 os.makedirs(directory, exist_ok=True)
+            except OSError:
+                pass
+
+    # When several entries share a path (e.g. the static auth templates added after the
+    # AI's files), only the last one may be written: written concurrently, an earlier
+    # entry's black run could overwrite it. Written serially, the last one always won.
+    unique_files = list({
+        os.path.normpath(f.file_path): f for f in generated_code.files
+    }.values())
+
+    max_workers = min(8, (os.cpu_count() or 1) * 2, len(unique_files))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(partial(_write_one, base_dir=base_dir), unique_files)
 
-            clean_content = unfence_code(code_file.content)
+        for file_path, error, formatted, format_problem in results:
+            if error is not None:
+                typer.secho(f"  ❌ Error creating file {file_path}: {error}", fg=typer.colors.RED)
+                # Decide if you want to stop the whole process or just skip this file
+                # raise typer.Exit(code=1) 
+                typer.secho(f"      Skipping file due to OS error.", fg=typer.colors.YELLOW)
+                continue
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(clean_content)
+            if format_problem is not None:
+                typer.secho(format_problem[0], fg=format_problem[1])
 
             typer.secho(f"  ✅ Created: {file_path}", fg=typer.colors.GREEN)
 
-            if file_path.endswith(".py"):
-                # Use the absolute path for formatting
-                absolute_file_path = os.path.abspath(file_path)
-                formatted = format_python_file(absolute_file_path)
-                if formatted:
-                    typer.secho(f"  ✨ Formatted: {os.path.basename(file_path)}", fg=typer.colors.BRIGHT_BLACK)
-                else:
-                    # Print a warning if formatting failed but file was created
-                    typer.secho(f"  ⚠️ Formatting failed for {os.path.basename(file_path)}, file may contain errors.", fg=typer.colors.YELLOW)
-
-
-        except OSError as e:
-            typer.secho(f"  ❌ Error creating file {file_path}: {e}", fg=typer.colors.RED)
-            # Decide if you want to stop the whole process or just skip this file
-            # raise typer.Exit(code=1) 
-            typer.secho(f"      Skipping file due to OS error.", fg=typer.colors.YELLOW)
+            if formatted:
+                typer.secho(f"  ✨ Formatted: {os.path.basename(file_path)}", fg=typer.colors.BRIGHT_BLACK)
+            elif formatted is not None:
+                # Print a warning if formatting failed but file was created
+                typer.secho(f"  ⚠️ Formatting failed for {os.path.basename(file_path)}, file may contain errors.", fg=typer.colors.YELLOW)